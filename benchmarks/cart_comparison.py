@@ -0,0 +1,79 @@
+"""Latency and statement count of GET /api/cart/comparison by cart size.
+
+Runs against a throwaway SQLite database seeded with the sample catalog:
+
+    python -m benchmarks.cart_comparison [--requests 20] [--sizes 1,10,40,90]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import uuid
+
+# The password hashing pool's workers import this module again; they inherit
+# the parent's directory
+if 'SHOPWISE_BENCH_DIR' not in os.environ:
+    os.environ['SHOPWISE_BENCH_DIR'] = tempfile.mkdtemp(prefix='shopwise-bench-')
+BENCH_DIR = os.environ['SHOPWISE_BENCH_DIR']
+os.environ.update({
+    'DATABASE_URL': 'sqlite:///' + os.path.join(BENCH_DIR, 'bench.db'),
+    'SECRET_KEY': 'bench-secret',
+    'DB_AUTO_MIGRATE': 'false',
+    'PASSWORD_HASH_ROUNDS': '4',
+    'ACTIVITY_WRITE_BEHIND': 'false',
+    'ACTIVITY_ARCHIVE_DIR': os.path.join(BENCH_DIR, 'activity-archive')
+})
+
+from sqlalchemy import event  # noqa: E402
+
+import app as shopwise  # noqa: E402  (needs the environment above)
+
+
+def login(client):
+    email = f'bench-{uuid.uuid4().hex[:12]}@example.com'
+    client.post('/api/register', json={'username': email, 'email': email, 'password': 'secret'})
+    token = client.post('/api/login', json={'email': email, 'password': 'secret'}).json['token']
+    return {'Authorization': 'Bearer ' + token}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=20)
+    parser.add_argument('--sizes', default='1,10,40,90')
+    args = parser.parse_args()
+
+    with shopwise.app.app_context():
+        shopwise.prepare_database()
+        shopwise.add_sample_products()
+        engine = shopwise.db.engine
+    client = shopwise.app.test_client()
+    product_ids = [p['id'] for p in client.get('/api/products?limit=1000&fields=id').json]
+
+    statements = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+    print(' items  statements/req  p50 ms  mean ms')
+    for size in (int(s) for s in args.sizes.split(',')):
+        headers = login(client)
+        for product_id in product_ids[:size]:
+            client.post('/api/cart', json={'product_id': product_id}, headers=headers)
+        client.get('/api/cart/comparison', headers=headers)  # Warm up
+        timings = []
+        statements.clear()
+        for _ in range(args.requests):
+            start = time.perf_counter()
+            client.get('/api/cart/comparison', headers=headers)
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f'{size:6d}  {len(statements) / args.requests:14.1f}  '
+              f'{statistics.median(timings):6.2f}  {statistics.mean(timings):7.2f}')
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    finally:
+        with shopwise.app.app_context():
+            shopwise.db.engine.dispose()
+        shutil.rmtree(BENCH_DIR, ignore_errors=True)
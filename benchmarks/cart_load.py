@@ -0,0 +1,108 @@
+"""Mixed cart load: 70% GET /api/cart, 30% POST /api/cart, from threads in one or more processes.
+
+Runs against a throwaway SQLite database seeded with the sample catalog, with
+whatever DB_PROFILE is set, so the two profiles can be compared:
+
+    python -m benchmarks.cart_load [--seconds 10] [--threads 8] [--processes 1]
+    DB_PROFILE=production python -m benchmarks.cart_load
+"""
+import argparse
+import contextlib
+import multiprocessing
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+
+# Worker processes (ours and the password hashing pool's) import this module
+# again; they inherit the parent's directory
+if 'SHOPWISE_BENCH_DIR' not in os.environ:
+    os.environ['SHOPWISE_BENCH_DIR'] = tempfile.mkdtemp(prefix='shopwise-bench-')
+BENCH_DIR = os.environ['SHOPWISE_BENCH_DIR']
+os.environ.update({
+    'DATABASE_URL': 'sqlite:///' + os.path.join(BENCH_DIR, 'bench.db'),
+    'SECRET_KEY': 'bench-secret',
+    'DB_AUTO_MIGRATE': 'false',
+    'PASSWORD_HASH_ROUNDS': '4',
+    'ACTIVITY_WRITE_BEHIND': 'false',
+    'ACTIVITY_ARCHIVE_DIR': os.path.join(BENCH_DIR, 'activity-archive')
+})
+
+import app as shopwise  # noqa: E402  (needs the environment above)
+
+READ_SHARE = 0.7
+
+
+def login(client):
+    email = f'bench-{uuid.uuid4().hex[:12]}@example.com'
+    client.post('/api/register', json={'username': email, 'email': email, 'password': 'secret'})
+    token = client.post('/api/login', json={'email': email, 'password': 'secret'}).json['token']
+    return {'Authorization': 'Bearer ' + token}
+
+
+def shop(headers, product_ids, deadline, totals, lock):
+    client = shopwise.app.test_client()
+    requests = errors = 0
+    while time.monotonic() < deadline:
+        if random.random() < READ_SHARE:
+            response = client.get('/api/cart', headers=headers)
+        else:
+            response = client.post('/api/cart', json={'product_id': random.choice(product_ids)}, headers=headers)
+        requests += 1
+        errors += response.status_code >= 400
+    with lock:
+        totals[0] += requests
+        totals[1] += errors
+
+
+# One process: a thread per user until the deadline. Returns (requests, errors).
+def run(users, product_ids, deadline):
+    totals, lock = [0, 0], threading.Lock()
+    threads = [threading.Thread(target=shop, args=(headers, product_ids, deadline, totals, lock)) for headers in users]
+    # add_to_cart still prints a line per request
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return tuple(totals)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--threads', type=int, default=8, help='threads per process')
+    parser.add_argument('--processes', type=int, default=1)
+    args = parser.parse_args()
+
+    client = shopwise.app.test_client()
+    with shopwise.app.app_context():
+        shopwise.prepare_database()
+        shopwise.add_sample_products()
+        product_ids = [p['id'] for p in client.get('/api/products?limit=1000&fields=id').json]
+        users = [[login(client) for _ in range(args.threads)] for _ in range(args.processes)]
+        shopwise.db.engine.dispose()  # Don't hand pooled connections to the workers
+
+    deadline = time.monotonic() + args.seconds
+    if args.processes == 1:
+        results = [run(users[0], product_ids, deadline)]
+    else:
+        # time.monotonic() is system-wide on Linux, so workers can share the deadline
+        with multiprocessing.Pool(args.processes) as pool:
+            results = pool.starmap(run, [(batch, product_ids, deadline) for batch in users])
+    requests = sum(r for r, _ in results)
+    errors = sum(e for _, e in results)
+    print(f"DB_PROFILE={shopwise.app.config['DB_PROFILE']} {args.processes} process(es) x {args.threads} threads: "
+          f'{requests / args.seconds:.0f} req/s, {errors} errors')
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    finally:
+        with shopwise.app.app_context():
+            shopwise.db.engine.dispose()
+        shutil.rmtree(BENCH_DIR, ignore_errors=True)
@@ -0,0 +1,74 @@
+"""Batched data backfills for revisions that run while the app is serving.
+
+A single ``UPDATE cart SET ...`` over the whole table holds the write lock
+(SQLite) or row locks (PostgreSQL) until it finishes, and every cart write
+waits behind it. ``batched_update`` walks the table in primary-key order
+instead, committing every ``batch_size`` rows, so writers wait for one short
+batch at most::
+
+    from alembic import op
+    import sqlalchemy as sa
+
+    from migrations.backfill import batched_update
+
+    def upgrade():
+        with op.batch_alter_table('cart') as batch_op:
+            batch_op.add_column(sa.Column('unit_price', sa.Float()))
+
+        cart = sa.table('cart', sa.column('id'), sa.column('product_id'), sa.column('unit_price'))
+        product = sa.table('product', sa.column('id'), sa.column('price'))
+        batched_update(
+            cart,
+            {'unit_price': sa.select(product.c.price)
+                .where(product.c.id == cart.c.product_id).scalar_subquery()},
+            where=cart.c.unit_price.is_(None)
+        )
+
+Give ``where`` a condition that only matches rows still to be done, so an
+interrupted backfill picks up where it stopped when the upgrade is rerun.
+For backfills that aren't a plain UPDATE, ``key_batches`` yields the same
+batches of primary keys to run any statement over.
+"""
+import time
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def key_batches(table, where=None, key='id', batch_size=1000, pause=0.01):
+    """Yield the keys of ``table`` in ascending batches, each a list.
+
+    Must be used from a revision's ``upgrade()``/``downgrade()``. The
+    revision's own transaction is committed first, and whatever the caller
+    runs per batch commits on its own. Schema changes the backfill depends
+    on therefore have to come before it in the same revision. ``pause``
+    seconds are slept between batches to leave room for other writers.
+    """
+    key_column = table.c[key]
+    last_key = None
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            query = sa.select(key_column).order_by(key_column).limit(batch_size)
+            if where is not None:
+                query = query.where(where)
+            if last_key is not None:
+                query = query.where(key_column > last_key)
+            keys = [row[0] for row in bind.execute(query)]
+            if not keys:
+                return
+
+            yield keys
+            last_key = keys[-1]
+            if pause:
+                time.sleep(pause)
+
+
+def batched_update(table, values, where=None, key='id', batch_size=1000, pause=0.01):
+    """UPDATE ``table`` SET ``values`` in key_batches(); returns the rows updated."""
+    key_column = table.c[key]
+    updated = 0
+    for keys in key_batches(table, where, key, batch_size, pause):
+        op.get_bind().execute(sa.update(table).where(key_column.in_(keys)).values(values))
+        updated += len(keys)
+    return updated
@@ -0,0 +1,163 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 02:48:15.961762
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_product_category', 'product', ['category'], False),
+    ('ix_product_price', 'product', ['price'], False),
+    ('ix_recipe_name', 'recipe', ['name'], False),
+    ('ix_activity_user_timestamp', 'activity', ['user_id', 'timestamp'], False),
+    ('uq_cart_user_product', 'cart', ['user_id', 'product_id'], True),
+    ('ix_product_feature_product', 'product_feature', ['product_id', 'feature_category', 'importance_score'], False),
+    ('ix_product_score_score', 'product_score', ['score', 'product_id'], False),
+    ('ix_recipe_ingredient_name', 'recipe_ingredient', ['name'], False),
+    ('ix_recipe_ingredient_recipe_id', 'recipe_ingredient', ['recipe_id'], False),
+    ('ix_recipe_ingredient_term', 'recipe_ingredient', ['term', 'recipe_id', 'name'], False),
+]
+
+
+def upgrade():
+    # database.db files created by db.create_all() before migrations existed
+    # already have some or all of these tables; create only what's missing
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'product' not in tables:
+        op.create_table('product',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('price', sa.Float(), nullable=False),
+            sa.Column('barcode', sa.String(length=50), nullable=True),
+            sa.Column('image_url', sa.String(length=200), nullable=True),
+            sa.Column('category', sa.String(length=50), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('barcode')
+        )
+
+    if 'recipe' not in tables:
+        op.create_table('recipe',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=False),
+            sa.Column('description', sa.Text(), nullable=False),
+            sa.Column('ingredients', sa.JSON(), nullable=False),
+            sa.Column('cooking_time', sa.String(length=50), nullable=False),
+            sa.Column('difficulty', sa.String(length=20), nullable=False),
+            sa.Column('image_url', sa.String(length=200), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'user' not in tables:
+        op.create_table('user',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('username', sa.String(length=80), nullable=False),
+            sa.Column('email', sa.String(length=120), nullable=False),
+            sa.Column('password_hash', sa.String(length=128), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('email'),
+            sa.UniqueConstraint('username')
+        )
+
+    if 'activity' not in tables:
+        op.create_table('activity',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('activity_type', sa.String(length=50), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('timestamp', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'cart' not in tables:
+        op.create_table('cart',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('product_id', sa.Integer(), nullable=False),
+            sa.Column('quantity', sa.Integer(), nullable=True),
+            sa.Column('added_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['product_id'], ['product.id'], ),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'product_feature' not in tables:
+        op.create_table('product_feature',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('product_id', sa.Integer(), nullable=False),
+            sa.Column('feature_name', sa.String(length=100), nullable=False),
+            sa.Column('feature_value', sa.String(length=200), nullable=False),
+            sa.Column('feature_unit', sa.String(length=50), nullable=True),
+            sa.Column('feature_category', sa.String(length=50), nullable=True),
+            sa.Column('importance_score', sa.Float(), nullable=True),
+            sa.ForeignKeyConstraint(['product_id'], ['product.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'product_score' not in tables:
+        op.create_table('product_score',
+            sa.Column('product_id', sa.Integer(), nullable=False),
+            sa.Column('score', sa.Float(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['product_id'], ['product.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('product_id')
+        )
+
+    if 'recipe_ingredient' not in tables:
+        op.create_table('recipe_ingredient',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('recipe_id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=False),
+            sa.Column('term', sa.String(length=100), nullable=False),
+            sa.ForeignKeyConstraint(['recipe_id'], ['recipe.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'cart' in tables:
+        # Older databases could hold several lines for the same product;
+        # fold them into one before the unique index goes on
+        op.execute("""
+            UPDATE cart SET quantity = (
+                SELECT SUM(c2.quantity) FROM cart c2
+                WHERE c2.user_id = cart.user_id AND c2.product_id = cart.product_id
+            )
+            WHERE id IN (
+                SELECT MIN(id) FROM cart GROUP BY user_id, product_id HAVING COUNT(*) > 1
+            )
+        """)
+        op.execute("""
+            DELETE FROM cart WHERE id NOT IN (
+                SELECT MIN(id) FROM cart GROUP BY user_id, product_id
+            )
+        """)
+
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns, unique in INDEXES:
+        if name not in {index['name'] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns, unique=unique)
+
+
+def downgrade():
+    op.drop_table('recipe_ingredient')
+    op.drop_table('product_score')
+    op.drop_table('product_feature')
+    op.drop_table('cart')
+    op.drop_table('activity')
+    op.drop_table('user')
+    op.drop_table('recipe')
+    op.drop_table('product')
@@ -0,0 +1,80 @@
+"""Daily activity counts by type
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 03:40:12.512043
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.backfill import key_batches
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    tables = set(sa.inspect(bind).get_table_names())
+    if 'activity_daily_count' not in tables:
+        op.create_table('activity_daily_count',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('activity_type', sa.String(length=50), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+        sa.PrimaryKeyConstraint('user_id', 'day', 'activity_type')
+        )
+
+    # The backfill counts events up to the last id present now; once this
+    # transaction commits, insert_activities() counts the newer ones itself.
+    # Counts go to a scratch table first and are only added to
+    # activity_daily_count at the very end, in the transaction that records
+    # the revision, so an interrupted run is rerun from scratch without
+    # counting anything twice.
+    if 'activity_daily_count_backfill' in tables:
+        max_id = bind.execute(sa.text('SELECT max_id FROM activity_daily_count_backfill_state')).scalar()
+        bind.execute(sa.text('DELETE FROM activity_daily_count_backfill'))
+    else:
+        max_id = bind.execute(sa.text('SELECT max(id) FROM activity')).scalar() or 0
+        op.create_table('activity_daily_count_backfill',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('activity_type', sa.String(length=50), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False)
+        )
+        state = op.create_table('activity_daily_count_backfill_state',
+        sa.Column('max_id', sa.Integer(), nullable=False)
+        )
+        op.bulk_insert(state, [{'max_id': max_id}])
+
+    # Count the events already in the activity table, a batch of ids at a time
+    day = 'date(timestamp)' if bind.dialect.name == 'sqlite' else 'CAST(timestamp AS DATE)'
+    count = sa.text(f"""
+        INSERT INTO activity_daily_count_backfill (user_id, day, activity_type, count)
+        SELECT user_id, {day}, activity_type, COUNT(*) FROM activity
+        WHERE id BETWEEN :first AND :last AND timestamp IS NOT NULL
+        GROUP BY user_id, {day}, activity_type
+    """)
+    activity = sa.table('activity', sa.column('id'))
+    for ids in key_batches(activity, where=activity.c.id <= max_id, batch_size=5000):
+        op.get_bind().execute(count, {'first': ids[0], 'last': ids[-1]})
+
+    op.execute("""
+        INSERT INTO activity_daily_count (user_id, day, activity_type, count)
+        SELECT user_id, day, activity_type, SUM(count) FROM activity_daily_count_backfill
+        WHERE true
+        GROUP BY user_id, day, activity_type
+        ON CONFLICT (user_id, day, activity_type) DO UPDATE SET count = activity_daily_count.count + excluded.count
+    """)
+    op.drop_table('activity_daily_count_backfill')
+    op.drop_table('activity_daily_count_backfill_state')
+
+
+def downgrade():
+    op.drop_table('activity_daily_count')
@@ -0,0 +1,36 @@
+"""Catalog version counters
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 04:21:37.204518
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    catalog_version = op.create_table('catalog_version',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    now = datetime.utcnow()
+    op.bulk_insert(catalog_version, [
+        {'name': name, 'version': 1, 'updated_at': now}
+        for name in ('product', 'product_feature', 'product_score', 'recipe')
+    ])
+
+
+def downgrade():
+    op.drop_table('catalog_version')
@@ -0,0 +1,27 @@
+"""Rebuild recipe ingredient terms
+
+recipe_ingredient now stores every phrase of an ingredient name as a term,
+not just runs of up to three words. Clearing the table lets the backfill in
+prepare_database (or flask backfill-recipe-ingredients) rebuild it.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 11:02:18.530164
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('DELETE FROM recipe_ingredient')
+
+
+def downgrade():
+    op.execute('DELETE FROM recipe_ingredient')
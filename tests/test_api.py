@@ -0,0 +1,253 @@
+"""API suite: the public endpoints, run against the database picked in conftest.py."""
+import json
+import uuid
+
+import app as shopwise
+
+
+def new_barcode():
+    return 'T' + uuid.uuid4().hex[:12]
+
+
+def test_register_rejects_duplicate_email(client, user):
+    response = client.post('/api/register', json={'username': 'again', 'email': user['email'], 'password': 'x'})
+    assert response.status_code == 400
+
+
+def test_login_with_wrong_password(client, user):
+    response = client.post('/api/login', json={'email': user['email'], 'password': 'wrong'})
+    assert response.status_code == 401
+
+
+def test_protected_routes_need_a_token(client):
+    assert client.get('/api/cart').status_code == 401
+    assert client.get('/api/cart', headers={'Authorization': 'Bearer nonsense'}).status_code == 401
+
+
+def test_user_profile(client, user):
+    response = client.get('/api/user/profile', headers=user['headers'])
+    assert response.status_code == 200
+    assert response.json['email'] == user['email']
+
+
+def test_product_pages_follow_the_cursor(client):
+    seen = []
+    url = '/api/products?limit=25&fields=id,name'
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        assert all(set(p) == {'id', 'name'} for p in response.json)
+        seen += [p['id'] for p in response.json]
+        url = response.headers.get('Link', '').partition('>')[0][1:] or None
+    assert len(seen) == len(set(seen)) >= 92
+    assert seen == sorted(seen)
+
+
+def test_score_sorted_pages_follow_the_cursor(client):
+    first = client.get('/api/products?sort=score&limit=10')
+    second = client.get('/api/products', query_string={
+        'sort': 'score', 'limit': 10,
+        'after_id': first.headers['X-Next-After-Id'],
+        'after_score': first.headers['X-Next-After-Score']
+    })
+    scores = [p['sustainability_score'] for p in first.json + second.json]
+    assert scores == sorted(scores, reverse=True)
+    assert not {p['id'] for p in first.json} & {p['id'] for p in second.json}
+
+
+def test_product_listing_filters(client):
+    response = client.get('/api/products?category=Dairy&min_price=1&max_price=100')
+    assert response.status_code == 200
+    assert response.json
+    assert all(p['category'] == 'Dairy' and 1 <= p['price'] <= 100 for p in response.json)
+
+
+def test_product_stream(client):
+    response = client.get('/api/products?stream=ndjson')
+    assert response.mimetype == 'application/x-ndjson'
+    products = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert len(products) >= 92
+
+
+def test_catalog_etag_and_cache_hit(client):
+    first = client.get('/api/products?limit=5')
+    assert first.headers['ETag']
+    assert client.get('/api/products?limit=5', headers={'If-None-Match': first.headers['ETag']}).status_code == 304
+
+    again = client.get('/api/products?limit=5')
+    assert again.headers['X-Cache'] == 'HIT'
+    assert again.json == first.json
+    # Paged clients rely on these on every response, cached or not
+    assert again.headers['X-Next-After-Id'] == first.headers['X-Next-After-Id']
+    assert again.headers['Link'] == first.headers['Link']
+
+
+def test_catalog_write_changes_the_etag(client):
+    product_id = client.get('/api/products?limit=1').json[0]['id']
+    before = client.get(f'/api/products/{product_id}')
+    with shopwise.app.app_context():
+        product = shopwise.db.session.get(shopwise.Product, product_id)
+        product.price += 1
+        shopwise.db.session.commit()
+    after = client.get(f'/api/products/{product_id}', headers={'If-None-Match': before.headers['ETag']})
+    assert after.status_code == 200
+    assert after.json['price'] == before.json['price'] + 1
+
+
+def test_product_features(client, user):
+    product_id = client.get('/api/products?limit=1').json[0]['id']
+    response = client.get(f'/api/products/{product_id}/features', headers=user['headers'])
+    assert response.status_code == 200
+    assert all(f['feature_name'] for f in response.json)
+
+
+def test_product_search(client, user):
+    response = client.get('/api/products/search?q=milk', headers=user['headers'])
+    assert response.status_code == 200
+    assert any('milk' in (p['name'] + ' ' + (p['description'] or '')).lower() for p in response.json)
+
+
+def test_substring_search_is_capped(client, user, monkeypatch):
+    monkeypatch.setattr(shopwise, 'search_products_fts', lambda query: None)
+    monkeypatch.setitem(shopwise.app.config, 'PRODUCT_SEARCH_LIMIT', 3)
+    response = client.get('/api/products/search?q=a', headers=user['headers'])
+    assert response.status_code == 200
+    assert len(response.json) == 3
+
+
+def test_barcode_lookup(client):
+    product = client.get('/api/products?limit=1&fields=id,barcode').json[0]
+    response = client.get(f"/api/products/barcode/{product['barcode']}")
+    assert response.status_code == 200
+    assert response.json['id'] == product['id']
+    assert client.get(f'/api/products/barcode/{new_barcode()}').status_code == 404
+
+
+def test_barcode_batch(client):
+    product = client.get('/api/products?limit=1&fields=id,barcode').json[0]
+    unknown = new_barcode()
+    response = client.post('/api/products/barcode:batch', json={'barcodes': [product['barcode'], unknown, unknown]})
+    assert response.status_code == 200
+    assert response.json['found'][product['barcode']]['id'] == product['id']
+    assert response.json['missing'] == [unknown]
+    assert client.post('/api/products/barcode:batch', json={'barcodes': []}).status_code == 400
+
+
+def test_new_product_replaces_a_cached_barcode_miss(client):
+    barcode = new_barcode()
+    assert client.get(f'/api/products/barcode/{barcode}').status_code == 404
+    with shopwise.app.app_context():
+        shopwise.db.session.add(shopwise.Product(name='Test product', price=1.0, barcode=barcode))
+        shopwise.db.session.commit()
+    assert client.get(f'/api/products/barcode/{barcode}').status_code == 200
+
+
+def test_cart_add_update_and_remove(client, user):
+    product_ids = [p['id'] for p in client.get('/api/products?limit=3&fields=id').json]
+    for product_id in product_ids:
+        assert client.post('/api/cart', json={'product_id': product_id}, headers=user['headers']).status_code == 201
+    client.post('/api/cart', json={'product_id': product_ids[0], 'quantity': 2}, headers=user['headers'])
+
+    cart = client.get('/api/cart', headers=user['headers']).json
+    assert {item['product']['id']: item['quantity'] for item in cart} == {
+        product_ids[0]: 3, product_ids[1]: 1, product_ids[2]: 1
+    }
+
+    response = client.patch('/api/cart', json={'operations': [
+        {'op': 'set', 'product_id': product_ids[0], 'quantity': 5},
+        {'op': 'remove', 'product_id': product_ids[1]},
+        {'op': 'add', 'product_id': product_ids[2], 'quantity': -1}
+    ]}, headers=user['headers'])
+    assert response.status_code == 200
+    assert [(item['product']['id'], item['quantity']) for item in response.json] == [(product_ids[0], 5)]
+
+    item_id = response.json[0]['id']
+    assert client.delete(f'/api/cart/{item_id}', headers=user['headers']).status_code == 200
+    assert client.get('/api/cart', headers=user['headers']).json == []
+
+
+def test_cart_rejects_unknown_products(client, user):
+    assert client.post('/api/cart', json={'product_id': 10 ** 9}, headers=user['headers']).status_code == 404
+    response = client.patch('/api/cart', json={'operations': [{'op': 'add', 'product_id': 10 ** 9}]},
+                            headers=user['headers'])
+    assert response.status_code == 404
+
+
+def test_cart_comparison(client, user):
+    product_id = client.get('/api/products?limit=1&fields=id').json[0]['id']
+    client.post('/api/cart', json={'product_id': product_id}, headers=user['headers'])
+    response = client.get('/api/cart/comparison', headers=user['headers'])
+    assert response.status_code == 200
+    assert [row['product_id'] for row in response.json] == [product_id]
+    assert 'sustainability_score' in response.json[0]
+
+
+def test_activity_feed_pages_and_summary(client, user):
+    for i in range(5):
+        response = client.post('/api/activities', json={'activity_type': 'view', 'description': str(i)},
+                               headers=user['headers'])
+        assert response.status_code == 201
+
+    first = client.get('/api/activities?limit=3', headers=user['headers'])
+    second = client.get('/api/activities', query_string={
+        'limit': 3,
+        'after_timestamp': first.headers['X-Next-After-Timestamp'],
+        'after_id': first.headers['X-Next-After-Id']
+    }, headers=user['headers'])
+    descriptions = [a['description'] for a in first.json + second.json]
+    assert descriptions == ['4', '3', '2', '1', '0']
+
+    summary = client.get('/api/activities/summary', headers=user['headers']).json
+    assert summary['totals'] == {'view': 5}
+
+
+def test_activity_needs_a_type(client, user):
+    for body in ({}, {'activity_type': None}, {'activity_type': ''}, ['view']):
+        assert client.post('/api/activities', json=body, headers=user['headers']).status_code == 400
+
+
+def test_recipes(client, user):
+    response = client.get('/api/recipes', headers=user['headers'])
+    assert response.status_code == 200
+    assert len(response.json['recipes']) >= 3
+
+    response = client.get('/api/recipes/search?query=pasta', headers=user['headers'])
+    assert all('pasta' in (r['name'] + r['description']).lower() for r in response.json['recipes'])
+
+
+def test_recipes_matching_the_cart(client, user):
+    with shopwise.app.app_context():
+        product = shopwise.Product.query.filter_by(name='Basmati Rice – India Gate').one()
+        recipes = [
+            shopwise.Recipe(name=f'Test {name} {uuid.uuid4().hex[:8]}', description='Test', ingredients=ingredients,
+                            cooking_time='10 mins', difficulty='Easy')
+            for name, ingredients in (('pulao', ['basmati rice', 'peas']), ('dal', ['red lentils', 'turmeric']))
+        ]
+        shopwise.db.session.add_all(recipes)
+        shopwise.db.session.commit()
+        product_id, (pulao_id, dal_id) = product.id, [recipe.id for recipe in recipes]
+
+    client.post('/api/cart', json={'product_id': product_id}, headers=user['headers'])
+    response = client.get('/api/recipes/search?matchCart=true', headers=user['headers'])
+    assert response.status_code == 200
+    matched = {r['id']: r['matchedIngredients'] for r in response.json['recipes']}
+    assert matched[pulao_id] == ['basmati rice']
+    assert dal_id not in matched
+
+
+def test_import_catalog_skips_bad_rows(tmp_path):
+    barcode = new_barcode()
+    feed = tmp_path / 'feed.ndjson'
+    feed.write_text('\n'.join([
+        json.dumps({'name': 'Imported', 'price': 2.5, 'barcode': barcode,
+                    'features': [['Recyclable', 'Yes', None, 'Environmental', 1.0]]}),
+        '{"name": "truncated", ',
+        '["not", "an", "object"]',
+        json.dumps({'name': 'Null value', 'price': 1, 'barcode': new_barcode(),
+                    'features': [{'feature_name': 'Origin', 'feature_value': None}]})
+    ]) + '\n')
+    with shopwise.app.app_context():
+        stats = shopwise.import_catalog(str(feed), 'ndjson', batch_size=2)
+        product = shopwise.Product.query.filter_by(barcode=barcode).one()
+        assert [f.feature_name for f in product.features] == ['Recyclable']
+    assert stats == {'rows': 4, 'added': 1, 'updated': 0, 'invalid': 3}
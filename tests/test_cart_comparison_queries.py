@@ -0,0 +1,33 @@
+"""GET /api/cart/comparison runs a fixed number of statements, whatever the cart size."""
+import pytest
+from sqlalchemy import event
+
+import app as shopwise
+
+
+def statements_for(client, headers):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with shopwise.app.app_context():
+        engine = shopwise.db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        response = client.get('/api/cart/comparison', headers=headers)
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+    assert response.status_code == 200
+    return len(response.json), statements
+
+
+@pytest.mark.parametrize('size', [1, 40])
+def test_comparison_statement_count(client, user, size):
+    product_ids = [p['id'] for p in client.get(f'/api/products?limit={size}&fields=id').json]
+    for product_id in product_ids:
+        client.post('/api/cart', json={'product_id': product_id}, headers=user['headers'])
+    lines, statements = statements_for(client, user['headers'])
+    assert lines == size
+    # One joined select for lines and products, one IN select for their features
+    assert len(statements) == 2, statements
@@ -0,0 +1,25 @@
+"""Concurrent adds to one cart line must merge into a single row."""
+from concurrent.futures import ThreadPoolExecutor
+
+import app as shopwise
+
+
+def test_concurrent_adds_merge_into_one_line(user):
+    with shopwise.app.app_context():
+        product_id = shopwise.db.session.execute(shopwise.db.select(shopwise.Product.id).limit(1)).scalar()
+    threads, adds_per_thread = 16, 10
+
+    def add_repeatedly(_):
+        client = shopwise.app.test_client()
+        return [
+            client.post('/api/cart', json={'product_id': product_id, 'quantity': 2}, headers=user['headers']).status_code
+            for _ in range(adds_per_thread)
+        ]
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        statuses = [status for result in pool.map(add_repeatedly, range(threads)) for status in result]
+    assert statuses == [201] * threads * adds_per_thread
+
+    with shopwise.app.app_context():
+        lines = shopwise.Cart.query.filter_by(user_id=user['id'], product_id=product_id).all()
+        assert [line.quantity for line in lines] == [2 * threads * adds_per_thread]
@@ -0,0 +1,17 @@
+"""Query-plan regression test: every hot query must be answered through an index."""
+import pytest
+
+import app as shopwise
+
+with shopwise.app.app_context():
+    HOT_QUERY_NAMES = [name for name, _ in shopwise.hot_queries()]
+
+
+@pytest.mark.parametrize('name', HOT_QUERY_NAMES)
+def test_hot_query_uses_an_index(name):
+    with shopwise.app.app_context():
+        if shopwise.db.engine.dialect.name != 'sqlite':
+            pytest.skip('EXPLAIN QUERY PLAN is SQLite only')
+        statement = dict(shopwise.hot_queries())[name]
+        details, full_scan = shopwise.explain_query_plan(statement)
+    assert not full_scan, f"{name} scans a whole table: {'; '.join(details)}"
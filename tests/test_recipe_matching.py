@@ -0,0 +1,50 @@
+"""Cart-to-recipe matching against recipe_ingredient."""
+import uuid
+
+import pytest
+
+import app as shopwise
+
+
+@pytest.fixture
+def recipes():
+    """Adds recipes with the given ingredient lists, returning their ids; removed afterwards."""
+    added = []
+
+    def add(*ingredient_lists):
+        with shopwise.app.app_context():
+            batch = [shopwise.Recipe(name=f'Test recipe {uuid.uuid4().hex[:8]}', description='Test',
+                                     ingredients=list(ingredients), cooking_time='10 mins', difficulty='Easy')
+                     for ingredients in ingredient_lists]
+            shopwise.db.session.add_all(batch)
+            shopwise.db.session.commit()
+            added.extend(recipe.id for recipe in batch)
+            return [recipe.id for recipe in batch]
+
+    yield add
+    with shopwise.app.app_context():
+        for recipe_id in added:
+            shopwise.db.session.delete(shopwise.db.session.get(shopwise.Recipe, recipe_id))
+        shopwise.db.session.commit()
+
+
+def matches(product_names):
+    with shopwise.app.app_context():
+        return dict(shopwise.match_recipes(product_names))
+
+
+def test_ingredient_inside_the_product_name(recipes):
+    recipe_id, = recipes(['bell peppers', 'olive oil'])
+    assert matches(['red bell pepper'])[recipe_id] == {'bell pepper'}
+
+
+def test_product_name_inside_the_ingredient(recipes):
+    recipe_id, = recipes(['smoked paprika powder', 'salt'])
+    assert matches(['paprika'])[recipe_id] == {'smoked paprika powder'}
+
+
+def test_a_shared_word_is_not_a_match(recipes):
+    lentils, chilli = recipes(['red lentils', 'cumin'], ['chilli powder'])
+    found = matches(['red chilli powder'])
+    assert lentils not in found
+    assert found[chilli] == {'chilli powder'}
@@ -0,0 +1,52 @@
+"""WriteBehindBuffer: outages are retried, rejected rows are dropped on their own."""
+import time
+
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+import app as shopwise
+
+
+def wait_until_flushed(buffer, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        stats = buffer.stats()
+        if stats['depth'] == 0 and stats['writing'] == 0:
+            return stats
+        time.sleep(0.01)
+    raise AssertionError(f'buffer not flushed: {buffer.stats()}')
+
+
+def test_outage_keeps_the_rows():
+    written = []
+    outage_until = time.monotonic() + 0.5
+
+    def write(rows):
+        if time.monotonic() < outage_until:
+            raise OperationalError('INSERT', {}, Exception('database is locked'))
+        written.extend(rows)
+
+    buffer = shopwise.WriteBehindBuffer(write, batch_size=10, interval=0.05, max_size=1000, max_backoff=0.2)
+    for i in range(100):
+        assert buffer.put(i)
+    stats = wait_until_flushed(buffer)
+    buffer.close()
+    assert sorted(written) == list(range(100))
+    assert stats['dropped'] == 0
+    assert stats['failures'] > 0
+
+
+def test_rejected_row_is_dropped_alone():
+    written = []
+
+    def write(rows):
+        if 13 in rows:
+            raise IntegrityError('INSERT', {}, Exception('NOT NULL constraint failed'))
+        written.extend(rows)
+
+    buffer = shopwise.WriteBehindBuffer(write, batch_size=50, interval=0.05, max_size=1000)
+    for i in range(100):
+        buffer.put(i)
+    stats = wait_until_flushed(buffer)
+    buffer.close()
+    assert sorted(written) == [i for i in range(100) if i != 13]
+    assert stats['dropped'] == 1